@@ -13,15 +13,26 @@ Usage:
 import sys
 import os
 import argparse
+import json
 import logging
-from datetime import datetime
-from typing import List, Tuple, Optional
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Tuple, Optional
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 
 # Try to load python-dotenv if available
 try:
@@ -30,6 +41,13 @@ try:
 except ImportError:
     pass  # python-dotenv not installed, will use environment variables or defaults
 
+# Use orjson for faster response parsing if available
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads  # orjson not installed, fall back to the standard library
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -40,8 +58,24 @@ logger = logging.getLogger(__name__)
 # API Configuration
 API_BASE_URL = "https://api.deepearth.digital"
 API_ENDPOINT = "/api/sst/point"
-# Load API key from environment variable, with fallback to default
-API_KEY = os.getenv("API_KEY", "fallback_api_key")
+API_URL = f"{API_BASE_URL}{API_ENDPOINT}"
+# Bulk time series endpoint (returns a whole series in one response).
+# Requires server support; the point endpoint is used when unavailable.
+API_TIMESERIES_URL = f"{API_BASE_URL}{API_ENDPOINT}/timeseries"
+# Query parameters sent with every point request
+API_PARAMS = {
+    "data_source": "timeseries-graph",
+    "zoom_level": 5,
+    "max_points": 4000,
+    "radius": 2.0
+}
+# Response field holding the value for each data type
+SST_FIELDS = {
+    'mean': 'temperature',
+    'anomaly': 'anomaly',
+}
+# Load API key once from the environment (API_KEY is accepted for compatibility)
+API_KEY = os.getenv("DEEPEARTH_SST_API_KEY", os.getenv("API_KEY", ""))
 
 # Default location (Mediterranean)
 DEFAULT_LAT = 38.13
@@ -52,6 +86,275 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 DEFAULT_OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'example_output')
 DEFAULT_OUTPUT_FILE = os.path.join(DEFAULT_OUTPUT_DIR, 'sst_timeseries.png')
+# Screen resolution by default; use 300 for print quality
+DEFAULT_DPI = 100
+
+# Pillow encoder options by output file extension: light, fast PNG
+# compression (larger files, much less encoding time) and WebP quality
+SAVE_PIL_KWARGS = {
+    'png': {'compress_level': 1, 'optimize': False},
+    'webp': {'quality': 90},
+}
+
+# Persistent cache of API results, so re-runs don't refetch the same points
+DEFAULT_CACHE_FILE = os.path.join(PROJECT_ROOT, '.cache', 'sst_cache.sqlite')
+CACHE_EXPIRY = timedelta(days=30)
+
+# Connection pool size for the shared HTTP session
+HTTP_POOL_MAXSIZE = 64
+
+# Number of API requests in flight at once
+DEFAULT_WORKERS = 8
+
+# Retry policy for transient API failures (exponential backoff)
+HTTP_RETRIES = 5
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Start pacing requests once no more than this many are left in the quota
+RATE_LIMIT_RESERVE = 10
+# Upper bound on each server-requested rate limit wait (Retry-After etc.)
+MAX_RATE_LIMIT_WAIT = 60.0
+
+
+class CappedRetry(Retry):
+    """
+    Retry policy that waits as long as a rate-limited response asks, via
+    Retry-After or X-RateLimit-Reset, but never longer than MAX_RATE_LIMIT_WAIT.
+    """
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = get_rate_limit_wait(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RATE_LIMIT_WAIT)
+
+
+def create_session(api_key: str = API_KEY, pool_maxsize: int = HTTP_POOL_MAXSIZE) -> requests.Session:
+    """
+    Create an HTTP session for talking to the API.
+    
+    The session keeps connections alive between requests, so only the first
+    call of a run pays for the TCP/TLS handshake. Transient failures are
+    retried with exponential backoff; rate-limited responses wait as long as
+    the server asks, up to MAX_RATE_LIMIT_WAIT seconds per retry.
+    
+    Args:
+        api_key: API key for authentication (default: from environment)
+        pool_maxsize: Number of connections kept open; should be at least the
+            number of threads sharing the session
+        
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    retry = CappedRetry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "X-API-Key": api_key,
+        "Content-Type": "application/json"
+    })
+    return session
+
+
+# Shared session (authenticated with API_KEY) used when no session is passed in
+_SESSION = create_session()
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of API values keyed by (lat, lon, date, data_type).
+    
+    Only successful values are stored; entries older than `expire_after` are
+    ignored. Safe to share between worker threads. Pass ':memory:' as the
+    path for a cache that only lasts for the current process.
+    """
+    
+    def __init__(self, path: str = DEFAULT_CACHE_FILE, expire_after: timedelta = CACHE_EXPIRY):
+        cache_dir = os.path.dirname(path)
+        if cache_dir and not os.path.exists(cache_dir):
+            os.makedirs(cache_dir, exist_ok=True)
+        
+        self.path = path
+        self.expire_after = expire_after
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sst_values ("
+            "lat REAL, lon REAL, date TEXT, data_type TEXT, value REAL, fetched_at REAL, "
+            "PRIMARY KEY (lat, lon, date, data_type))"
+        )
+        self._conn.commit()
+    
+    def get(self, lat: float, lon: float, date: str, data_type: str) -> Optional[float]:
+        """Return the cached value, or None if missing or expired."""
+        min_fetched_at = time.time() - self.expire_after.total_seconds()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM sst_values "
+                "WHERE lat = ? AND lon = ? AND date = ? AND data_type = ? AND fetched_at >= ?",
+                (lat, lon, date, data_type, min_fetched_at)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def put(self, lat: float, lon: float, date: str, data_type: str, value: float) -> None:
+        """Store a successfully fetched value."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sst_values VALUES (?, ?, ?, ?, ?, ?)",
+                (lat, lon, date, data_type, value, time.time())
+            )
+            self._conn.commit()
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces out API requests across all workers.
+    
+    Requests are only throttled when a minimum interval was requested, or
+    once the quota the API reports (via X-RateLimit-Remaining/X-RateLimit-Reset)
+    is nearly used up, i.e. fewer requests are left in the current window than
+    this run still plans to send (or than RATE_LIMIT_RESERVE). The remaining
+    quota is then spread evenly until the window resets.
+    """
+    
+    def __init__(self, min_interval: float = 0.0, planned_requests: int = 0):
+        self.min_interval = min_interval
+        self._planned_requests = planned_requests
+        self._server_interval = 0.0
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """Block until the next request may be sent."""
+        with self._lock:
+            self._planned_requests = max(self._planned_requests - 1, 0)
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + max(self.min_interval, self._server_interval)
+        if start > now:
+            time.sleep(start - now)
+    
+    def update(self, response: requests.Response) -> None:
+        """Adapt to the rate limit announced in a response's headers."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            remaining_count = int(remaining)
+        except ValueError:
+            return
+        window = get_rate_limit_wait(response)
+        if window is None:
+            return
+        with self._lock:
+            if remaining_count > max(self._planned_requests, RATE_LIMIT_RESERVE):
+                # Enough quota left for the rest of the run: don't throttle
+                self._server_interval = 0.0
+            else:
+                self._server_interval = window / max(remaining_count, 1)
+
+
+def get_rate_limit_wait(response: Any) -> Optional[float]:
+    """
+    Work out how long the server asked us to wait before the next request.
+    
+    Checks the Retry-After header (seconds or HTTP date) first, then
+    X-RateLimit-Reset (seconds until reset, or a Unix timestamp).
+    
+    Args:
+        response: Rate-limited API response (requests or urllib3 response)
+        
+    Returns:
+        Wait time in seconds, or None if the server did not say
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    
+    reset = response.headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            reset_value = float(reset)
+        except ValueError:
+            return None
+        # Large values are absolute Unix timestamps rather than a delta
+        if reset_value > 1e9:
+            reset_value -= time.time()
+        return max(0.0, reset_value)
+    
+    return None
+
+
+def request_sst_point(
+    params: Dict[str, Any],
+    session: requests.Session,
+    url: str = API_URL,
+    limiter: Optional[RateLimiter] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Make a single point request and return the response's data object.
+    
+    Args:
+        params: Complete query parameters, i.e. API_PARAMS plus lat, lon,
+            date and data_type
+        session: Session to make the request with
+        url: Full URL of the point endpoint
+        limiter: Rate limiter to wait on before, and update after, the request
+        
+    Returns:
+        The 'data' object of a successful response, or None if request failed
+    """
+    date = params["date"]
+    data_type = params["data_type"]
+    
+    try:
+        if limiter is not None:
+            limiter.wait()
+        # The session retries 429/5xx responses itself (see CappedRetry)
+        response = session.get(url, params=params, timeout=30)
+        
+        if limiter is not None:
+            limiter.update(response)
+        
+        if response.status_code == 200:
+            data = json_loads(response.content)
+            if data.get('status') == 'success':
+                return data.get('data', {})
+            else:
+                logger.warning(f"API returned non-success status for {date} ({data_type}): {data.get('detail', 'Unknown error')}")
+        else:
+            logger.warning(f"API request failed for {date} ({data_type}): HTTP {response.status_code}")
+            
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"Request exception for {date} ({data_type}): {e}")
+    except Exception as e:
+        logger.warning(f"Unexpected error for {date} ({data_type}): {e}")
+    
+    return None
 
 
 def fetch_sst_data(
@@ -59,9 +362,10 @@ def fetch_sst_data(
     lon: float,
     data_type: str,
     date: str,
-    api_key: str,
-    base_url: str = API_BASE_URL,
-    endpoint: str = API_ENDPOINT
+    url: str = API_URL,
+    session: Optional[requests.Session] = None,
+    cache: Optional[ResponseCache] = None,
+    limiter: Optional[RateLimiter] = None
 ) -> Optional[float]:
     """
     Fetch SST data for a single point and date.
@@ -71,74 +375,162 @@ def fetch_sst_data(
         lon: Longitude
         data_type: 'mean' or 'anomaly'
         date: Date in YYYY-MM-DD format
-        api_key: API key for authentication
-        base_url: Base URL for the API
-        endpoint: API endpoint path
+        url: Full URL of the point endpoint
+        session: Session to make the request with (the shared, API_KEY-authenticated
+            session if omitted)
+        cache: Cache to consult before, and update after, the API call; values
+            for other data types in the response are stored too
+        limiter: Rate limiter shared with other requests (no throttling if omitted)
         
     Returns:
         Temperature or anomaly value, or None if request failed
     """
-    params = {
+    return fetch_sst_point(
+        lat, lon, date, url=url, session=session, cache=cache, limiter=limiter,
+        data_types=(data_type,)
+    )[data_type]
+
+
+def fetch_sst_point(
+    lat: float,
+    lon: float,
+    date: str,
+    url: str = API_URL,
+    session: Optional[requests.Session] = None,
+    cache: Optional[ResponseCache] = None,
+    limiter: Optional[RateLimiter] = None,
+    data_types: Tuple[str, ...] = tuple(SST_FIELDS)
+) -> Dict[str, Optional[float]]:
+    """
+    Fetch both SST temperature and anomaly for a single point and date.
+    
+    Every field present in a response is used, so when the API returns the
+    anomaly alongside the temperature the separate anomaly request is skipped.
+    
+    Args:
+        lat: Latitude
+        lon: Longitude
+        date: Date in YYYY-MM-DD format
+        url: Full URL of the point endpoint
+        session: Session to make the requests with (the shared, API_KEY-authenticated
+            session if omitted)
+        cache: Cache to consult before, and update after, the API calls
+        limiter: Rate limiter shared with other requests (no throttling if omitted)
+        data_types: Data types to request, in order (both if omitted)
+        
+    Returns:
+        Dict mapping 'mean' and 'anomaly' to their values (None if request failed)
+    """
+    values: Dict[str, Optional[float]] = dict.fromkeys(SST_FIELDS)
+    
+    if cache is not None:
+        for data_type in SST_FIELDS:
+            values[data_type] = cache.get(lat, lon, date, data_type)
+    
+    if session is None:
+        session = _SESSION
+    
+    # Build the parameters shared by both requests once
+    point_params = dict(API_PARAMS, lat=lat, lon=lon, date=date)
+    
+    for data_type in data_types:
+        if values[data_type] is not None:
+            continue  # Cached, or returned alongside an earlier data type
+        
+        params = dict(point_params, data_type=data_type)
+        data_obj = request_sst_point(params, session, url, limiter)
+        if data_obj is None:
+            continue
+        
+        for other_type, field in SST_FIELDS.items():
+            value = data_obj.get(field)
+            if values[other_type] is None and value is not None:
+                values[other_type] = value
+                if cache is not None:
+                    cache.put(lat, lon, date, other_type, value)
+    
+    return values
+
+
+def fetch_sst_timeseries(
+    lat: float,
+    lon: float,
+    dates: List[str],
+    session: requests.Session,
+    url: str = API_TIMESERIES_URL,
+    limiter: Optional[RateLimiter] = None
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Fetch temperature and anomaly for all dates with a single bulk request.
+    
+    POSTs {lat, lon, dates, data_types} and expects a 'data' object with
+    'temperature' and 'anomaly' lists aligned with `dates` (null where
+    missing).
+    
+    Args:
+        lat: Latitude
+        lon: Longitude
+        dates: Dates in YYYY-MM-DD format
+        session: Session to make the request with
+        url: Full URL of the bulk time series endpoint
+        limiter: Rate limiter to wait on before, and update after, the request
+        
+    Returns:
+        Tuple of (temperatures, anomalies) arrays with NaN for missing values,
+        or None if the request failed or the endpoint is not available
+    """
+    payload = {
         "lat": lat,
         "lon": lon,
-        "data_type": data_type,
-        "date": date,
-        "data_source": "timeseries-graph",
-        "zoom_level": 5,
-        "max_points": 4000,
-        "radius": 2.0
-    }
-    
-    headers = {
-        "X-API-Key": api_key,
-        "Content-Type": "application/json"
+        "dates": dates,
+        "data_types": list(SST_FIELDS),
+        "data_source": API_PARAMS["data_source"]
     }
     
     try:
-        response = requests.get(
-            f"{base_url}{endpoint}",
-            params=params,
-            headers=headers,
-            timeout=30
-        )
+        if limiter is not None:
+            limiter.wait()
+        response = session.post(url, json=payload, timeout=60)
+        if limiter is not None:
+            limiter.update(response)
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             if data.get('status') == 'success':
                 data_obj = data.get('data', {})
-                if data_type == 'mean':
-                    return data_obj.get('temperature')
-                else:  # anomaly
-                    return data_obj.get('anomaly')
+                temperatures = np.array(data_obj.get('temperature', []), dtype=float)
+                anomalies = np.array(data_obj.get('anomaly', []), dtype=float)
+                if len(temperatures) == len(dates) and len(anomalies) == len(dates):
+                    return temperatures, anomalies
+                logger.warning("Bulk time series response does not match the requested dates")
             else:
-                logger.warning(f"API returned non-success status for {date} ({data_type}): {data.get('detail', 'Unknown error')}")
+                logger.warning(f"Bulk time series request returned non-success status: {data.get('detail', 'Unknown error')}")
         else:
-            logger.warning(f"API request failed for {date} ({data_type}): HTTP {response.status_code}")
+            logger.warning(f"Bulk time series request failed: HTTP {response.status_code}")
             
     except requests.exceptions.RequestException as e:
-        logger.warning(f"Request exception for {date} ({data_type}): {e}")
+        logger.warning(f"Bulk time series request exception: {e}")
     except Exception as e:
-        logger.warning(f"Unexpected error for {date} ({data_type}): {e}")
+        logger.warning(f"Unexpected error in bulk time series request: {e}")
     
     return None
 
 
-def generate_yearly_dates(start_year: int, end_year: int) -> List[str]:
+def generate_yearly_sample_dates(start_year: int, end_year: int) -> np.ndarray:
     """
-    Generate list of dates (6th November) for each year from start_year to end_year.
+    Generate the sample date (6th November) for each year from start_year to end_year.
     
     Args:
         start_year: Starting year (inclusive)
         end_year: Ending year (inclusive)
         
     Returns:
-        List of date strings in YYYY-MM-DD format
+        Array of dates with dtype datetime64[D]
     """
-    dates = []
-    for year in range(start_year, end_year + 1):
-        dates.append(datetime(year, 11, 6).strftime('%Y-%m-%d'))
-    
-    return dates
+    years = np.arange(start_year, end_year + 1) - 1970
+    # Year -> 1st November (month offset 10) -> 6th November (day offset 5)
+    months = years.astype('datetime64[Y]').astype('datetime64[M]') + 10
+    return months.astype('datetime64[D]') + 5
 
 
 def collect_timeseries_data(
@@ -146,9 +538,13 @@ def collect_timeseries_data(
     lon: float,
     start_year: int,
     end_year: int,
-    api_key: str,
-    delay: float = 0.1
-) -> Tuple[List[datetime], List[Optional[float]], List[Optional[float]]]:
+    api_key: str = API_KEY,
+    delay: float = 0.0,
+    session: Optional[requests.Session] = None,
+    workers: int = DEFAULT_WORKERS,
+    cache: Optional[ResponseCache] = None,
+    bulk: bool = False
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Collect SST temperature and anomaly data for the specified date range.
     
@@ -157,106 +553,255 @@ def collect_timeseries_data(
         lon: Longitude
         start_year: Starting year
         end_year: Ending year
-        api_key: API key
-        delay: Delay between API calls in seconds
+        api_key: API key used if a new session is created (default: from environment)
+        delay: Minimum delay between API calls in seconds, for servers that don't
+            advertise their rate limit (0 to only follow the server's headers)
+        session: Session shared by all worker threads; its connection pool should
+            hold at least `workers` connections. If omitted, a session is created
+            for this call and closed afterwards, so pass one in to keep
+            connections alive across repeated calls
+        workers: Maximum number of concurrent API requests
+        cache: Cache of previously fetched values (no caching if omitted)
+        bulk: Try the bulk time series endpoint first, falling back to one
+            request per date if it is unavailable
         
     Returns:
-        Tuple of (dates, temperatures, anomalies)
+        Tuple of (dates, temperatures, anomalies) arrays; dates are datetime64[D]
+        and missing temperature/anomaly values are NaN
     """
-    dates_str = generate_yearly_dates(start_year, end_year)
-    dates = [datetime.strptime(d, '%Y-%m-%d') for d in dates_str]
+    if session is None:
+        # One pooled connection per worker thread, closed once collection is done
+        with create_session(api_key, pool_maxsize=workers) as own_session:
+            return collect_timeseries_data(
+                lat, lon, start_year, end_year, api_key, delay,
+                session=own_session, workers=workers, cache=cache, bulk=bulk
+            )
     
-    temperatures = []
-    anomalies = []
+    dates = generate_yearly_sample_dates(start_year, end_year)
+    dates_str = np.datetime_as_string(dates).tolist()
     
     total = len(dates_str)
-    logger.info(f"Collecting data for {total} yearly samples (6th November) from {start_year} to {end_year}...")
+    temperatures = np.full(total, np.nan)
+    anomalies = np.full(total, np.nan)
+    
+    # At most two point requests per date, plus the bulk request if tried
+    limiter = RateLimiter(delay, planned_requests=2 * total + int(bulk))
+    
+    if bulk and cache is not None:
+        # Skip the bulk request entirely when every value is already cached.
+        # Only real values are cached, so a series with any missing sample
+        # never takes this shortcut and is re-requested in bulk
+        for i, date_str in enumerate(dates_str):
+            temp = cache.get(lat, lon, date_str, 'mean')
+            anom = cache.get(lat, lon, date_str, 'anomaly')
+            if temp is None or anom is None:
+                break
+            temperatures[i] = temp
+            anomalies[i] = anom
+        else:
+            logger.info(f"All {total} yearly samples (6th November) from {start_year} to {end_year} found in cache")
+            return dates, temperatures, anomalies
+    
+    if bulk:
+        logger.info(f"Requesting {total} yearly samples (6th November) from {start_year} to {end_year} in a single bulk request...")
+        series = fetch_sst_timeseries(lat, lon, dates_str, session, limiter=limiter)
+        if series is not None:
+            temperatures, anomalies = series
+            if cache is not None:
+                for date_str, temp, anom in zip(dates_str, temperatures, anomalies):
+                    if np.isfinite(temp):
+                        cache.put(lat, lon, date_str, 'mean', float(temp))
+                    if np.isfinite(anom):
+                        cache.put(lat, lon, date_str, 'anomaly', float(anom))
+            logger.info(f"Data collection complete. Retrieved {np.count_nonzero(np.isfinite(temperatures))} temperature values and {np.count_nonzero(np.isfinite(anomalies))} anomaly values.")
+            return dates, temperatures, anomalies
+        logger.info("Bulk time series endpoint unavailable, falling back to per-date requests")
+    
+    def fetch_job(date_str: str) -> Dict[str, Optional[float]]:
+        return fetch_sst_point(lat, lon, date_str, session=session, cache=cache, limiter=limiter)
+    
+    logger.info(f"Collecting data for {total} yearly samples (6th November) from {start_year} to {end_year} using {workers} workers...")
     
-    for i, date_str in enumerate(dates_str):
-        # Show progress
-        if (i + 1) % 5 == 0 or i == 0:
-            logger.info(f"Progress: {i + 1}/{total} ({100 * (i + 1) / total:.1f}%)")
+    # One job per date; results are written back by index
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(fetch_job, date_str): i for i, date_str in enumerate(dates_str)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            values = future.result()
+            if values['mean'] is not None:
+                temperatures[i] = values['mean']
+            if values['anomaly'] is not None:
+                anomalies[i] = values['anomaly']
+            
+            # Show progress
+            if done % 5 == 0 or done == 1 or done == total:
+                logger.info(f"Progress: {done}/{total} ({100 * done / total:.1f}%)")
+    
+    logger.info(f"Data collection complete. Retrieved {np.count_nonzero(np.isfinite(temperatures))} temperature values and {np.count_nonzero(np.isfinite(anomalies))} anomaly values.")
+    
+    return dates, temperatures, anomalies
+
+
+# Figure and axes kept between create_graph(reuse_fig=True) calls
+_FIG: Optional[Figure] = None
+_AX1: Optional[Axes] = None
+_AX2: Optional[Axes] = None
+
+
+def get_graph_axes(reuse_fig: bool = False, interactive: bool = False) -> Tuple[Figure, Axes, Axes]:
+    """
+    Get a figure with a temperature axis and a twinned anomaly axis.
+    
+    Non-interactive figures are drawn on an Agg canvas without going through
+    pyplot, so the caller's matplotlib backend and open figures are untouched.
+    
+    Args:
+        reuse_fig: Clear and return the figure from the previous call made with
+            reuse_fig=True instead of creating a new one
+        interactive: Create the figure through pyplot so it can be shown
         
-        # Fetch mean (temperature)
-        temp = fetch_sst_data(lat, lon, 'mean', date_str, api_key)
-        temperatures.append(temp)
-        time.sleep(delay)  # Small delay to avoid rate limiting
+    Returns:
+        Tuple of (figure, temperature axes, anomaly axes)
+    """
+    global _FIG, _AX1, _AX2
+    
+    reusable = False
+    if reuse_fig and _FIG is not None:
+        managed = _FIG.canvas.manager is not None
+        reusable = managed == interactive and (not managed or plt.fignum_exists(_FIG.number))
+    
+    if reusable:
+        _AX1.clear()
+        _AX2.clear()
+        # Clearing resets the twin axis to the left-hand side
+        _AX2.yaxis.tick_right()
+        _AX2.yaxis.set_label_position('right')
+        _AX2.patch.set_visible(False)
+        return _FIG, _AX1, _AX2
+    
+    if interactive:
+        fig, ax1 = plt.subplots(figsize=(14, 8))
+    else:
+        fig = Figure(figsize=(14, 8))
+        FigureCanvasAgg(fig)
+        ax1 = fig.add_subplot()
+    ax2 = ax1.twinx()
+    if reuse_fig:
+        _FIG, _AX1, _AX2 = fig, ax1, ax2
+    return fig, ax1, ax2
+
+
+def finite_points(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Drop the points of a series whose y value is missing (NaN or infinite).
+    
+    Args:
+        x: X values
+        y: Y values, aligned with x
         
-        # Fetch anomaly
-        anom = fetch_sst_data(lat, lon, 'anomaly', date_str, api_key)
-        anomalies.append(anom)
-        time.sleep(delay)  # Small delay to avoid rate limiting
+    Returns:
+        Tuple of (x, y) arrays containing only the finite points
+    """
+    mask = np.isfinite(y)
+    return x[mask], y[mask]
+
+
+def plot_series(ax: Axes, x: np.ndarray, y: np.ndarray, **kwargs: Any) -> LineCollection:
+    """
+    Draw a line series as a single LineCollection artist.
     
-    logger.info(f"Data collection complete. Retrieved {sum(1 for t in temperatures if t is not None)} temperature values and {sum(1 for a in anomalies if a is not None)} anomaly values.")
+    The whole series is one polyline, so segments are joined rather than
+    overlapping (which would show as darker spots with alpha < 1).
     
-    return dates, temperatures, anomalies
+    Args:
+        ax: Axes to draw on
+        x: X values (matplotlib date numbers)
+        y: Y values
+        **kwargs: Passed through to LineCollection (color, linewidth, label, ...)
+        
+    Returns:
+        The added LineCollection
+    """
+    kwargs.setdefault('capstyle', 'round')
+    kwargs.setdefault('joinstyle', 'round')
+    segments = [np.column_stack([x, y])] if len(x) > 1 else []
+    collection = LineCollection(segments, **kwargs)
+    ax.add_collection(collection)
+    # Collections don't trigger autoscaling, so fit the view to the data
+    ax.update_datalim(np.column_stack([x, y]))
+    ax.autoscale_view()
+    return collection
 
 
 def create_graph(
-    dates: List[datetime],
-    temperatures: List[Optional[float]],
-    anomalies: List[Optional[float]],
+    dates: np.ndarray,
+    temperatures: np.ndarray,
+    anomalies: np.ndarray,
     lat: float,
     lon: float,
-    output_file: str = DEFAULT_OUTPUT_FILE
+    output_file: str = DEFAULT_OUTPUT_FILE,
+    show: bool = False,
+    dpi: int = DEFAULT_DPI,
+    reuse_fig: bool = False
 ) -> None:
     """
     Create and save a time series graph showing both temperature and anomaly.
     
     Args:
-        dates: List of datetime objects
-        temperatures: List of temperature values (can contain None)
-        anomalies: List of anomaly values (can contain None)
+        dates: Array of dates (datetime64 or datetime objects)
+        temperatures: Array of temperature values (NaN where missing)
+        anomalies: Array of anomaly values (NaN where missing)
         lat: Latitude for title
         lon: Longitude for title
-        output_file: Output filename
+        output_file: Output filename (.png, .webp, .pdf, .svg, ...)
+        show: Display the graph in a window after saving it (otherwise the graph
+            is rendered off-screen with Agg, without using pyplot)
+        dpi: Resolution of the saved image in dots per inch
+        reuse_fig: Draw on the figure kept from the previous reuse_fig=True call
+            instead of building a new one (useful when generating many graphs)
     """
-    # Filter out None values for plotting
-    temp_dates = [d for d, t in zip(dates, temperatures) if t is not None]
-    temp_values = [t for t in temperatures if t is not None]
+    # Convert dates to matplotlib's float day numbers once, so plotting
+    # bypasses the per-element datetime converter
+    x = mdates.date2num(dates)
     
-    anom_dates = [d for d, a in zip(dates, anomalies) if a is not None]
-    anom_values = [a for a in anomalies if a is not None]
+    # Filter out missing values for plotting
+    temp_x, temp_values = finite_points(x, temperatures)
+    anom_x, anom_values = finite_points(x, anomalies)
     
-    # Create figure with dual y-axis
-    fig, ax1 = plt.subplots(figsize=(14, 8))
+    # Create (or reuse) figure with dual y-axis
+    fig, ax1, ax2 = get_graph_axes(reuse_fig, interactive=show)
     
     # Plot temperature on left y-axis
     color1 = 'tab:blue'
     ax1.set_xlabel('Date', fontsize=12)
     ax1.set_ylabel('SST Temperature (°C)', color=color1, fontsize=12)
-    line1 = ax1.plot(temp_dates, temp_values, color=color1, linewidth=1.5, label='Temperature', alpha=0.8)
+    temp_series = plot_series(ax1, temp_x, temp_values, color=color1, linewidth=1.5, label='Temperature', alpha=0.8)
     ax1.tick_params(axis='y', labelcolor=color1)
     ax1.grid(True, alpha=0.3)
     
     # Calculate and plot temperature trend line
-    if len(temp_dates) > 1 and len(temp_values) > 1:
-        # Convert dates to numeric values (days since epoch) for regression
-        temp_dates_numeric = mdates.date2num(temp_dates)
+    if len(temp_x) > 1:
         # Calculate linear trend
-        temp_trend = np.polyfit(temp_dates_numeric, temp_values, 1)
+        temp_trend = np.polyfit(temp_x, temp_values, 1)
         temp_trend_line = np.poly1d(temp_trend)
         # Plot trend line
-        ax1.plot(temp_dates, temp_trend_line(temp_dates_numeric), 
+        ax1.plot(temp_x, temp_trend_line(temp_x), 
                 color=color1, linestyle='--', linewidth=2, 
                 label='Temperature Trend', alpha=0.6)
     
     # Plot anomaly on right y-axis
-    ax2 = ax1.twinx()
     color2 = 'tab:red'
     ax2.set_ylabel('SST Anomaly (°C)', color=color2, fontsize=12)
-    line2 = ax2.plot(anom_dates, anom_values, color=color2, linewidth=1.5, label='Anomaly', alpha=0.8)
+    anom_series = plot_series(ax2, anom_x, anom_values, color=color2, linewidth=1.5, label='Anomaly', alpha=0.8)
     ax2.tick_params(axis='y', labelcolor=color2)
     
     # Calculate and plot anomaly trend line
-    if len(anom_dates) > 1 and len(anom_values) > 1:
-        # Convert dates to numeric values (days since epoch) for regression
-        anom_dates_numeric = mdates.date2num(anom_dates)
+    if len(anom_x) > 1:
         # Calculate linear trend
-        anom_trend = np.polyfit(anom_dates_numeric, anom_values, 1)
+        anom_trend = np.polyfit(anom_x, anom_values, 1)
         anom_trend_line = np.poly1d(anom_trend)
         # Plot trend line
-        ax2.plot(anom_dates, anom_trend_line(anom_dates_numeric), 
+        ax2.plot(anom_x, anom_trend_line(anom_x), 
                 color=color2, linestyle='--', linewidth=2, 
                 label='Anomaly Trend', alpha=0.6)
     
@@ -267,7 +812,7 @@ def create_graph(
     plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha='right')
     
     # Add title
-    plt.title(
+    ax2.set_title(
         f'SST Time Series: Temperature and Anomaly (6th November)\n'
         f'Location: {lat}°N, {lon}°E (1981-2025)',
         fontsize=14,
@@ -275,12 +820,10 @@ def create_graph(
         pad=20
     )
     
-    # Add legend - collect all lines from both axes
-    lines1 = ax1.get_lines()
-    lines2 = ax2.get_lines()
-    all_lines = lines1 + lines2
-    labels = [l.get_label() for l in all_lines]
-    ax1.legend(all_lines, labels, loc='upper left', fontsize=10)
+    # Add legend - each series followed by its trend line (if any) from both axes
+    handles = [temp_series, *ax1.get_lines(), anom_series, *ax2.get_lines()]
+    labels = [h.get_label() for h in handles]
+    ax1.legend(handles, labels, loc='upper left', fontsize=10)
     
     # Adjust layout
     fig.tight_layout()
@@ -291,16 +834,33 @@ def create_graph(
         os.makedirs(output_dir, exist_ok=True)
         logger.info(f"Created output directory: {output_dir}")
     
-    # Save figure
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    # Save figure (format follows the file extension)
+    save_kwargs = {}
+    output_format = os.path.splitext(output_file)[1].lstrip('.').lower()
+    if output_format in SAVE_PIL_KWARGS:
+        save_kwargs['pil_kwargs'] = SAVE_PIL_KWARGS[output_format]
+    fig.savefig(output_file, dpi=dpi, bbox_inches='tight', **save_kwargs)
     logger.info(f"Graph saved to {output_file}")
     
     # Optionally display
-    plt.show()
+    if show:
+        plt.show()
+    
+    # Release pyplot's reference to the figure, unless it is kept for the next graph
+    if show and not reuse_fig:
+        plt.close(fig)
 
 
-def main(argv: Optional[List[str]] = None) -> int:
-    """Main entry point."""
+def positive_int(value: str) -> int:
+    """Argparse type for integers of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Generate SST time series graph from API data"
     )
@@ -338,16 +898,70 @@ def main(argv: Optional[List[str]] = None) -> int:
         '--api-key',
         type=str,
         default=API_KEY,
-        help='API key (default: uses hardcoded key)'
+        help='API key (default: DEEPEARTH_SST_API_KEY or API_KEY environment variable)'
     )
     parser.add_argument(
         '--delay',
         type=float,
-        default=0.1,
-        help='Delay between API calls in seconds (default: 0.1)'
+        default=0.0,
+        help='Minimum delay between API calls in seconds; by default requests are only '
+             'throttled when the API reports its rate limit (default: 0)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=positive_int,
+        default=DEFAULT_WORKERS,
+        help=f'Maximum number of concurrent API requests (default: {DEFAULT_WORKERS})'
+    )
+    parser.add_argument(
+        '--dpi',
+        type=int,
+        default=DEFAULT_DPI,
+        help=f'Output image resolution in dots per inch; use 300 for print quality (default: {DEFAULT_DPI})'
+    )
+    parser.add_argument(
+        '--interactive',
+        action='store_true',
+        help='Display the graph in a window after saving it'
+    )
+    parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help='Fetch the whole series with one bulk request if the API supports it, '
+             'falling back to per-date requests otherwise'
+    )
+    parser.add_argument(
+        '--cache-file',
+        type=str,
+        default=DEFAULT_CACHE_FILE,
+        help=f'Cache file for API results (default: {DEFAULT_CACHE_FILE})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always fetch from the API, bypassing the results cache'
     )
     
-    args = parser.parse_args(argv)
+    return parser
+
+
+# Built once at import so repeated main() calls only parse
+_PARSER = build_parser()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = _PARSER.parse_args(argv)
+    
+    if not args.api_key:
+        logger.warning("No API key set; use --api-key or the DEEPEARTH_SST_API_KEY environment variable")
+    
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = ResponseCache(args.cache_file)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not open cache file {args.cache_file}, continuing without cache: {e}")
     
     try:
         # Collect data
@@ -357,7 +971,10 @@ def main(argv: Optional[List[str]] = None) -> int:
             args.start_year,
             args.end_year,
             args.api_key,
-            args.delay
+            args.delay,
+            workers=args.workers,
+            cache=cache,
+            bulk=args.bulk
         )
         
         # Create graph
@@ -367,7 +984,9 @@ def main(argv: Optional[List[str]] = None) -> int:
             anomalies,
             args.lat,
             args.lon,
-            args.output
+            args.output,
+            show=args.interactive,
+            dpi=args.dpi
         )
         
         logger.info("Script completed successfully")
@@ -379,6 +998,9 @@ def main(argv: Optional[List[str]] = None) -> int:
     except Exception as e:
         logger.error(f"Error: {e}", exc_info=True)
         return 1
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":